@@ -1,25 +1,206 @@
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QHBoxLayout, 
                               QVBoxLayout, QPushButton, QLabel, QFileDialog, QScrollArea, QSlider, QSpinBox, QCheckBox)
-from PySide6.QtCore import Qt, QPoint, QPointF, QSize, QTimer, QRectF
-from PySide6.QtGui import QImage, QPixmap, QPainter, QPen, QColor
+from PySide6.QtCore import Qt, QPoint, QPointF, QSize, QTimer, QRectF, QLine, QEvent
+from PySide6.QtGui import QImage, QPixmap, QPainter, QPen, QColor, QPicture, QPolygon
 import numpy as np
 from scipy.spatial import Delaunay
 import cv2
 import sys
 import imageio
-import csv
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 
-@dataclass
-class MorphPoint:
-    """Store points in normalized coordinates (0-1 range)"""
-    source: QPointF
-    target: QPointF
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+# Fixed anchor positions pinned on the image border (normalized coords)
+BORDER_ANCHORS = np.float32([(0, 0), (0.5, 0), (1, 0), (1, 0.5),
+                             (1, 1), (0.5, 1), (0, 1), (0, 0.5)])
+
+class MorphPoints:
+    """Store control points in normalized coordinates (0-1 range).
+
+    Structure-of-arrays: source and target coords live in two (N, 2)
+    float32 arrays (with capacity doubling on append), so the hot paths
+    get ndarrays directly instead of rebuilding them from a list of
+    Python objects every frame."""
+
+    def __init__(self):
+        self._capacity = 16
+        self._count = 0
+        self._source = np.zeros((self._capacity, 2), dtype=np.float32)
+        self._target = np.zeros((self._capacity, 2), dtype=np.float32)
+        self._locked = np.zeros(self._capacity, dtype=bool)
+
+    def __len__(self):
+        return self._count
+
+    @property
+    def source(self):
+        return self._source[:self._count]
+
+    @property
+    def target(self):
+        return self._target[:self._count]
+
+    @property
+    def locked(self):
+        return self._locked[:self._count]
+
+    def add(self, x, y, locked=False):
+        if self._count == self._capacity:
+            self._capacity *= 2
+            self._source = np.resize(self._source, (self._capacity, 2))
+            self._target = np.resize(self._target, (self._capacity, 2))
+            self._locked = np.resize(self._locked, self._capacity)
+        self._source[self._count] = (x, y)
+        self._target[self._count] = (x, y)
+        self._locked[self._count] = locked
+        self._count += 1
+
+    def remove(self, index):
+        self._source[index:self._count - 1] = self._source[index + 1:self._count]
+        self._target[index:self._count - 1] = self._target[index + 1:self._count]
+        self._locked[index:self._count - 1] = self._locked[index + 1:self._count]
+        self._count -= 1
+
+    def clear(self):
+        self._count = 0
+
+    def reset_targets(self):
+        self._target[:self._count] = self._source[:self._count]
+
+    def replace(self, source, target):
+        """Swap in a whole new point set (template loading)."""
+        source = np.asarray(source, dtype=np.float32).reshape(-1, 2)
+        target = np.asarray(target, dtype=np.float32).reshape(-1, 2)
+        self._count = len(source)
+        self._capacity = max(16, self._count)
+        self._source = np.resize(source, (self._capacity, 2))
+        self._target = np.resize(target, (self._capacity, 2))
+        self._locked = np.zeros(self._capacity, dtype=bool)
+
+def cuda_available():
+    """True if OpenCV was built with CUDA and a device is present."""
+    try:
+        return cv2.cuda.getCudaEnabledDeviceCount() > 0
+    except (AttributeError, cv2.error):
+        return False
+
+def rasterize_tri_ids(dst_pts, simplices, width, height, out=None):
+    """Label every destination pixel with the index of the triangle it
+    falls into (-1 where no triangle covers it). Writes into out when
+    given instead of allocating."""
+    if out is None:
+        out = np.empty((height, width), dtype=np.int32)
+    out.fill(-1)
+    for k, simplex in enumerate(simplices):
+        cv2.fillConvexPoly(out, dst_pts[simplex].astype(np.int32), int(k))
+    return out
+
+def solve_affines(from_tris, to_tris):
+    """Affines mapping each (T, 3, 2) triangle onto its counterpart.
+
+    One batched np.linalg.solve recovers the whole (T, 2, 3) stack in a
+    single LAPACK call instead of T cv2.getAffineTransform round-trips."""
+    ones = np.ones(from_tris.shape[:2] + (1,), dtype=from_tris.dtype)
+    lhs = np.concatenate([from_tris, ones], axis=2)  # (T, 3, 3)
+    return np.linalg.solve(lhs, to_tris).transpose(0, 2, 1)
+
+def inverse_affines(src_pts, dst_pts, simplices):
+    """Per-simplex 2x3 inverse affines (dst->src), shape (T+1, 2, 3).
+
+    The extra last row is the identity, used for pixels outside every
+    triangle so the maps can be filled with one gather, no masking."""
+    minv = np.empty((len(simplices) + 1, 2, 3), dtype=np.float32)
+    minv[:-1] = solve_affines(dst_pts[simplices], src_pts[simplices])
+    minv[-1] = [[1, 0, 0], [0, 1, 0]]
+    return minv
+
+if HAVE_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _fill_maps_jit(tri_id, minv, map_x, map_y):
+        height, width = tri_id.shape
+        identity = minv.shape[0] - 1
+        for y in prange(height):
+            for x in range(width):
+                k = tri_id[y, x]
+                if k < 0:
+                    k = identity
+                m = minv[k]
+                map_x[y, x] = m[0, 0] * x + m[0, 1] * y + m[0, 2]
+                map_y[y, x] = m[1, 0] * x + m[1, 1] * y + m[1, 2]
+
+def fill_maps(tri_id, minv, grid_x, grid_y, out_x=None, out_y=None):
+    """Fill map_x/map_y from the triangle-id image in one pass.
+
+    Uses a parallel Numba kernel when numba is installed; otherwise a
+    vectorized NumPy gather of each pixel's affine coefficients by
+    triangle id, applied to the coordinate grids. Writes into
+    out_x/out_y when given instead of allocating."""
+    if out_x is None:
+        out_x = np.empty_like(grid_x)
+    if out_y is None:
+        out_y = np.empty_like(grid_y)
+    if HAVE_NUMBA:
+        _fill_maps_jit(tri_id, minv, out_x, out_y)
+        return out_x, out_y
+    k = np.where(tri_id >= 0, tri_id, minv.shape[0] - 1)
+    np.multiply(minv[:, 0, 0][k], grid_x, out=out_x)
+    out_x += minv[:, 0, 1][k] * grid_y
+    out_x += minv[:, 0, 2][k]
+    np.multiply(minv[:, 1, 0][k], grid_x, out=out_y)
+    out_y += minv[:, 1, 1][k] * grid_y
+    out_y += minv[:, 1, 2][k]
+    return out_x, out_y
+
+def build_morph_maps(src_pts, dst_pts, simplices, width, height):
+    """Build the per-pixel map_x/map_y lookup for cv2.remap.
+
+    For each destination pixel the maps give the source pixel to sample,
+    via the inverse affine of the triangle the pixel falls into. Pixels
+    outside every triangle map to themselves."""
+    tri_id = rasterize_tri_ids(dst_pts, simplices, width, height)
+    minv = inverse_affines(src_pts, dst_pts, simplices)
+    grid_x, grid_y = np.meshgrid(np.arange(width, dtype=np.float32),
+                                 np.arange(height, dtype=np.float32))
+    return fill_maps(tri_id, minv, grid_x, grid_y)
+
+# Per-worker state for GIF rendering, set once by the pool initializer so
+# the source image and maps aren't pickled along with every frame task
+_gif_state = {}
+
+def _gif_worker_init(source_image, map_x_tgt, map_y_tgt):
+    height, width = source_image.shape[:2]
+    grid_x, grid_y = np.meshgrid(np.arange(width, dtype=np.float32),
+                                 np.arange(height, dtype=np.float32))
+    _gif_state['args'] = (source_image, map_x_tgt, map_y_tgt, grid_x, grid_y)
+    _gif_state['scratch'] = (np.empty_like(grid_x), np.empty_like(grid_y))
+
+def render_frame(t):
+    """Render one morph frame at interpolation factor t (pickle-safe,
+    runs in a worker process).
+
+    The mesh is fixed across t, so each frame's map is interpolated
+    between the identity grid (t=0) and the full-morph map (t=1): one
+    lerp into per-worker scratch buffers plus one remap. No Delaunay,
+    no affine solves and no rasterization per frame."""
+    source_image, map_x_tgt, map_y_tgt, grid_x, grid_y = _gif_state['args']
+    if t <= 0:
+        return source_image.copy()
+    map_x, map_y = _gif_state['scratch']
+    np.multiply(map_x_tgt, t, out=map_x)
+    map_x += (1 - t) * grid_x
+    np.multiply(map_y_tgt, t, out=map_y)
+    map_y += (1 - t) * grid_y
+    return cv2.remap(source_image, map_x, map_y, cv2.INTER_LINEAR)
 
 class ImageCanvas(QLabel):
     def __init__(self, is_target=False, parent=None):
         super().__init__(parent)
-        self.points = []  # Will store MorphPoint objects
+        self.points = MorphPoints()  # Shared with the sibling canvas
         self.selected_point = None
         self.dragging = False
         self.image = None
@@ -28,6 +209,27 @@ class ImageCanvas(QLabel):
         self.setMinimumSize(400, 400)
         self.setAlignment(Qt.AlignCenter)
         
+        # Cached Delaunay result for the overlay, keyed on point coords
+        self._tri_cache = None
+        self._tri_key = None
+
+        # Display caches: bump _image_rev per new frame, reuse the scaled
+        # base pixmap until the image/size change and skip the repaint
+        # entirely when the whole frame (image + overlay) is unchanged
+        self._image_rev = 0
+        self._scaled_image = None
+        self._scaled_key = None
+        self._frame_key = None
+
+        # Overlay (triangulation + points) recorded once into a QPicture
+        # and replayed until the points or view change
+        self._overlay_picture = None
+        self._overlay_key = None
+
+        # Set by anything that can change what's on screen; the timer
+        # tick does nothing while it's False
+        self._display_dirty = True
+
         # Setup update timer
         self.update_timer = QTimer(self)
         self.update_timer.timeout.connect(self.update_display)
@@ -68,15 +270,17 @@ class ImageCanvas(QLabel):
     
     def get_image_rect(self) -> QRectF:
         """Get the actual rectangle where image is displayed in widget space"""
-        if self.pixmap() is None:
+        if self.image is None:
             return QRectF()
-            
-        # Get current sizes
-        pixmap_size = self.pixmap().size()
+
+        # Derive the aspect from the current image, not self.pixmap() -
+        # the pixmap still shows the previous frame while a new image is
+        # being laid out, which would scale the overlay by a stale rect
+        img_height, img_width = self.image.shape[:2]
         widget_size = self.size()
-        
+
         # Calculate aspect ratios
-        pix_ratio = pixmap_size.width() / pixmap_size.height()
+        pix_ratio = img_width / img_height
         widget_ratio = widget_size.width() / widget_size.height()
         
         if widget_ratio > pix_ratio:
@@ -95,104 +299,182 @@ class ImageCanvas(QLabel):
         return QRectF(x, y, w, h)
     
     def set_image(self, image: np.ndarray):
-        """Set new image and update display"""
-        self.image = image.copy() if image is not None else None
+        """Set new image and update display.
+
+        The array is kept by reference (made contiguous if needed, which
+        is a no-op for the buffers the morph produces) - no per-frame
+        copy of the pixel data."""
+        self.image = np.ascontiguousarray(image) if image is not None else None
+        self._image_rev += 1
+        self._display_dirty = True
         self.update_display()
-    
+
     def update_display(self):
         """Update the display with current image and points"""
-        if self.image is None:
+        if self.image is None or not self._display_dirty:
             return
-            
-        # Convert numpy image to QImage
+
         height, width = self.image.shape[:2]
-        bytes_per_line = 3 * width
-        q_img = QImage(self.image.data, width, height, bytes_per_line, QImage.Format_RGB888).copy()
-        pixmap = QPixmap.fromImage(q_img)
-        
-        # Scale pixmap to fit widget while maintaining aspect ratio
-        pixmap = pixmap.scaled(self.size(), Qt.KeepAspectRatio, Qt.SmoothTransformation)
-        
-        # Create painter for annotations
-        painter = QPainter(pixmap)
-        
+        rect = self.get_image_rect()
+        coords = self.points.target if self.is_target else self.points.source
+        local_points = (coords * np.float32([rect.width(), rect.height()])).astype(np.int32)
+
+        # Cheap drag preview, full quality once the mouse is released
+        mode = Qt.FastTransformation if self.dragging else Qt.SmoothTransformation
+
+        # Nothing changed since the last tick: leave the pixmap alone
+        frame_key = (self._image_rev, self.size().width(), self.size().height(),
+                     mode, self.display_triangles, local_points.tobytes())
+        if frame_key == self._frame_key:
+            self._display_dirty = False
+            return
+
+        # Rebuild the scaled base only when the image bytes, widget size
+        # or transformation mode changed - not on overlay-only edits
+        scaled_key = frame_key[:4]
+        if scaled_key != self._scaled_key:
+            # No .copy(): scaled() produces a new image right away and
+            # self.image keeps the buffer alive while the view exists
+            bytes_per_line = 3 * width
+            q_img = QImage(self.image.data, width, height, bytes_per_line, QImage.Format_RGB888)
+            self._scaled_image = q_img.scaled(self.size(), Qt.KeepAspectRatio, mode)
+            self._scaled_key = scaled_key
+
+        # Paint the overlay onto a QImage and convert to a pixmap once
+        # at the end - no QPixmap round-trip for the annotations. The
+        # picture is in image-local coords so it lands on the image,
+        # not the widget
+        frame = self._scaled_image.copy()
+        painter = QPainter(frame)
+        painter.drawPicture(0, 0, self._get_overlay_picture(local_points))
+        painter.end()
+
+        self.setPixmap(QPixmap.fromImage(frame))
+        self._frame_key = frame_key
+        self._display_dirty = False
+
+    def _get_overlay_picture(self, points):
+        """Record the triangulation lines and control points into a
+        QPicture, reused until the point positions or view change.
+        points is an (N, 2) int array in pixmap-local coords."""
+        key = (self.display_triangles, points.tobytes())
+        if self._overlay_picture is not None and key == self._overlay_key:
+            return self._overlay_picture
+
+        picture = QPicture()
+        painter = QPainter(picture)
+        qpoints = [QPoint(int(x), int(y)) for x, y in points]
+
         # Draw triangulation
-        if self.display_triangles and len(self.points) >= 3:
-            points = [(self.get_widget_space_pos(p.target if self.is_target else p.source))
-                     for p in self.points]
-            points_array = np.array([(p.x(), p.y()) for p in points])
-            
+        if self.display_triangles and len(points) >= 3:
             try:
-                tri = Delaunay(points_array)
+                # Only retriangulate when the coords actually changed
+                tri_key = points.tobytes()
+                if self._tri_cache is None or tri_key != self._tri_key:
+                    self._tri_cache = Delaunay(points)
+                    self._tri_key = tri_key
+                tri = self._tri_cache
                 pen = QPen(QColor(0, 255, 0, 128))
                 pen.setWidth(1)
                 painter.setPen(pen)
-                
-                for simplex in tri.simplices:
-                    for i in range(3):
-                        j = (i + 1) % 3
-                        start = points[simplex[i]]
-                        end = points[simplex[j]]
-                        painter.drawLine(start, end)
+
+                # Each interior edge is shared by two simplices; dedupe
+                # and hand the painter one batch instead of 3T calls
+                edges = np.concatenate([tri.simplices[:, [0, 1]],
+                                        tri.simplices[:, [1, 2]],
+                                        tri.simplices[:, [2, 0]]])
+                edges = np.unique(np.sort(edges, axis=1), axis=0)
+                painter.drawLines([QLine(qpoints[a], qpoints[b])
+                                   for a, b in edges])
             except Exception as e:
                 print(f"Triangulation error: {e}")
-        
-        # Draw points
+
+        # Draw points in one batched call
         pen = QPen(Qt.red)
         pen.setWidth(5)
         painter.setPen(pen)
-        for point in self.points:
-            pos = self.get_widget_space_pos(point.target if self.is_target else point.source)
-            painter.drawPoint(pos)
-            
+        painter.drawPoints(QPolygon(qpoints))
+
         painter.end()
-        self.setPixmap(pixmap)
+        self._overlay_picture = picture
+        self._overlay_key = key
+        return picture
     
+    def _point_near(self, widget_pos: QPoint):
+        """Index of the first point within 10px (manhattan) of
+        widget_pos, or None."""
+        if len(self.points) == 0:
+            return None
+        coords = self.points.target if self.is_target else self.points.source
+        rect = self.get_image_rect()
+        widget_coords = coords * np.float32([rect.width(), rect.height()])
+        widget_coords += np.float32([rect.x(), rect.y()])
+        dist = np.abs(widget_coords - [widget_pos.x(), widget_pos.y()]).sum(axis=1)
+        hits = np.flatnonzero(dist < 10)
+        return int(hits[0]) if hits.size else None
+
+    def resizeEvent(self, event):
+        self._display_dirty = True
+        super().resizeEvent(event)
+
+    def showEvent(self, event):
+        self.update_timer.start(33)
+        self._display_dirty = True
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        # No point repainting a widget nobody can see
+        self.update_timer.stop()
+        super().hideEvent(event)
+
     def mousePressEvent(self, event):
+        self._display_dirty = True
         if event.button() == Qt.LeftButton:
-            # Convert to normalized coordinates
-            pos = self.get_image_space_pos(event.position().toPoint())
-            
             # Check if clicking near existing point
-            for i, point in enumerate(self.points):
-                curr_pos = point.target if self.is_target else point.source
-                widget_curr = self.get_widget_space_pos(curr_pos)
-                if (event.position().toPoint() - widget_curr).manhattanLength() < 10:
-                    self.selected_point = i
-                    self.dragging = True
+            hit = self._point_near(event.position().toPoint())
+            if hit is not None:
+                # Border anchors are pinned in place
+                if self.points.locked[hit]:
                     return
-                    
+                self.selected_point = hit
+                self.dragging = True
+                return
+
             # If not near existing point and not target canvas, add new point
             if not self.is_target:
-                self.points.append(MorphPoint(pos, pos))
-                if hasattr(self.parent(), "points_updated"):
-                    self.parent().points_updated()
-                    
+                pos = self.get_image_space_pos(event.position().toPoint())
+                self.points.add(pos.x(), pos.y())
+                if hasattr(self.window(), "points_updated"):
+                    self.window().points_updated()
+
         elif event.button() == Qt.RightButton and not self.is_target:
-            # Only allow deletion on source canvas
-            pos = event.position().toPoint()
-            for i, point in enumerate(self.points):
-                curr_pos = self.get_widget_space_pos(point.source)
-                if (pos - curr_pos).manhattanLength() < 10:
-                    self.points.pop(i)
-                    if hasattr(self.parent(), "points_updated"):
-                        self.parent().points_updated()
-                    break
-    
+            # Only allow deletion on source canvas; anchors stay
+            hit = self._point_near(event.position().toPoint())
+            if hit is not None and not self.points.locked[hit]:
+                self.points.remove(hit)
+                if hasattr(self.window(), "points_updated"):
+                    self.window().points_updated()
+
     def mouseMoveEvent(self, event):
         if self.dragging and self.selected_point is not None:
+            self._display_dirty = True
             pos = self.get_image_space_pos(event.position().toPoint())
             if self.is_target:
-                self.points[self.selected_point].target = pos
+                self.points.target[self.selected_point] = (pos.x(), pos.y())
             else:
-                self.points[self.selected_point].source = pos
-                
-            if hasattr(self.parent(), "points_updated"):
-                self.parent().points_updated()
-    
+                self.points.source[self.selected_point] = (pos.x(), pos.y())
+
+            if hasattr(self.window(), "points_updated"):
+                self.window().points_updated()
+
     def mouseReleaseEvent(self, event):
+        self._display_dirty = True
+        was_dragging = self.dragging
         self.dragging = False
         self.selected_point = None
+        # One full-resolution pass to replace the coarse drag preview
+        if was_dragging and hasattr(self.window(), "points_updated"):
+            self.window().points_updated()
 
 class MorphEditor(QMainWindow):
     def __init__(self):
@@ -285,86 +567,258 @@ class MorphEditor(QMainWindow):
         
         self.source_image = None
         self.target_image = None
-    
+
+        # Scratch buffers for the full-resolution morph, allocated once
+        # per image load and reused every frame
+        self._morph_buf = None
+        self._tri_id = None
+        self._map_x = None
+        self._map_y = None
+        self._grid_x = None
+        self._grid_y = None
+
+        # Preview downscale factor used while a point is being dragged
+        self.drag_scale = 4
+
+        # The 30Hz timer only recomputes the morph after an input change
+        self._morph_dirty = False
+
+        # Cached Delaunay result for the morph, keyed on source coords
+        self._tri_cache = None
+        self._tri_src_key = None
+
+        # Per-simplex inverse affines, patched incrementally during drags
+        self._affine_cache = None
+
+        # Optional CUDA backend: source image stays resident on the GPU
+        self._src_gpu = None
+        self._src_gpu_array = None
+
+    def _remap(self, image, map_x, map_y, dst=None):
+        """Run the remap on the GPU when the image is resident there,
+        otherwise on the CPU, writing into dst when given."""
+        if self._src_gpu is not None and image is self._src_gpu_array:
+            try:
+                mx_gpu = cv2.cuda_GpuMat()
+                my_gpu = cv2.cuda_GpuMat()
+                mx_gpu.upload(map_x)
+                my_gpu.upload(map_y)
+                dst_gpu = cv2.cuda.remap(self._src_gpu, mx_gpu, my_gpu,
+                                         cv2.INTER_LINEAR)
+                return dst_gpu.download(dst) if dst is not None else dst_gpu.download()
+            except cv2.error as e:
+                print(f"CUDA remap failed, falling back to CPU: {e}")
+                self._src_gpu = None
+                self._src_gpu_array = None
+        if dst is not None:
+            return cv2.remap(image, map_x, map_y, cv2.INTER_LINEAR, dst=dst)
+        return cv2.remap(image, map_x, map_y, cv2.INTER_LINEAR)
+
+    def get_triangulation(self, source_points):
+        """Return a Delaunay triangulation of source_points, reusing the
+        cached one when the coords haven't changed since last frame."""
+        key = source_points.tobytes()
+        if self._tri_cache is None or key != self._tri_src_key:
+            self._tri_cache = Delaunay(source_points)
+            self._tri_src_key = key
+        return self._tri_cache
+
+    def get_inverse_affines(self, source_points, target_points, simplices):
+        """Per-simplex inverse affines, updated incrementally.
+
+        Moving a target point leaves the source mesh untouched, so while
+        dragging only the simplices that contain the moved points need
+        their affine recomputed - the rest of the stack is reused."""
+        src_key = self._tri_src_key
+        if self._affine_cache is not None:
+            cached_key, cached_dst, minv = self._affine_cache
+            if cached_key == src_key and cached_dst.shape == target_points.shape:
+                changed = np.flatnonzero(np.any(cached_dst != target_points, axis=1))
+                if changed.size == 0:
+                    return minv
+                touched = np.flatnonzero(np.isin(simplices, changed).any(axis=1))
+                if touched.size:
+                    minv[touched] = solve_affines(target_points[simplices[touched]],
+                                                  source_points[simplices[touched]])
+                self._affine_cache = (src_key, target_points.copy(), minv)
+                return minv
+        minv = inverse_affines(source_points, target_points, simplices)
+        self._affine_cache = (src_key, target_points.copy(), minv)
+        return minv
+
+
+    def changeEvent(self, event):
+        # Drop to a 2Hz trickle while minimized, back to 30Hz on restore
+        if event.type() == QEvent.Type.WindowStateChange:
+            interval = 500 if self.isMinimized() else 33
+            self.morph_timer.setInterval(interval)
+            self.source_canvas.update_timer.setInterval(interval)
+            self.target_canvas.update_timer.setInterval(interval)
+        super().changeEvent(event)
+
+    def showEvent(self, event):
+        self.morph_timer.start(33)
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        self.morph_timer.stop()
+        super().hideEvent(event)
+
     def load_image(self):
         file_name, _ = QFileDialog.getOpenFileName(self, "Open Image File",
                                                  "", "Images (*.png *.xpm *.jpg *.bmp)")
         if file_name:
             image = cv2.imread(file_name)
             image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
-            
-            self.source_image = image.copy()
-            self.target_image = image.copy()
-            
+
+            # Contiguous interleaved uint8 is the layout OpenCV's SIMD
+            # remap/resize kernels (and the QImage wrapping) expect
+            self.source_image = np.ascontiguousarray(image, dtype=np.uint8)
+            self.target_image = self.source_image.copy()
+
+            # Seed the anchors first so the synchronous repaints below
+            # already include them on both canvases
+            self._add_border_anchors()
             self.source_canvas.set_image(self.source_image)
             self.target_canvas.set_image(self.target_image)
+            self._morph_dirty = True
+
+            # Upload once; every remap then reads from device memory
+            if cuda_available():
+                self._src_gpu = cv2.cuda_GpuMat()
+                self._src_gpu.upload(self.source_image)
+                self._src_gpu_array = self.source_image
+
+            # Scratch buffers reused by every full-resolution frame
+            height, width = self.source_image.shape[:2]
+            self._morph_buf = np.empty_like(self.source_image)
+            self._tri_id = np.empty((height, width), dtype=np.int32)
+            self._map_x = np.empty((height, width), dtype=np.float32)
+            self._map_y = np.empty((height, width), dtype=np.float32)
+            self._grid_x, self._grid_y = np.meshgrid(
+                np.arange(width, dtype=np.float32),
+                np.arange(height, dtype=np.float32))
     
     def toggle_triangles(self):
         self.source_canvas.display_triangles = not self.source_canvas.display_triangles
         self.target_canvas.display_triangles = not self.target_canvas.display_triangles
-    
+        self.source_canvas._display_dirty = True
+        self.target_canvas._display_dirty = True
+
+    def _add_border_anchors(self):
+        """Pin fixed anchor points on the image border (source == target)
+        so the Delaunay hull always covers the whole frame and sparse
+        user points can't produce a degenerate triangulation."""
+        points = self.source_canvas.points
+        for x, y in BORDER_ANCHORS:
+            if len(points):
+                match = np.flatnonzero(
+                    np.all(np.abs(points.source - (x, y)) < 1e-6, axis=1))
+                if match.size:
+                    points.locked[match[0]] = True
+                    continue
+            points.add(x, y, locked=True)
+
     def clear_points(self):
         self.source_canvas.points.clear()
-    
+        if self.source_image is not None:
+            self._add_border_anchors()
+        self._tri_cache = None
+        self._affine_cache = None
+        self._morph_dirty = True
+        self.source_canvas._display_dirty = True
+        self.target_canvas._display_dirty = True
+
     def reset_morph(self):
-        for point in self.source_canvas.points:
-            point.target = QPointF(point.source)
-    
+        self.source_canvas.points.reset_targets()
+        self._morph_dirty = True
+        self.source_canvas._display_dirty = True
+        self.target_canvas._display_dirty = True
+
     def points_updated(self):
-        if self.source_image is not None and len(self.source_canvas.points) >= 3:
-            self.update_morph()
-    
+        # The next timer tick picks this up; no work on the event itself
+        self._morph_dirty = True
+
     def update_morph(self):
-        if self.source_image is None or len(self.source_canvas.points) < 3:
+        if not self._morph_dirty:
             return
-            
+        points = self.source_canvas.points
+        if self.source_image is None or len(points) < 3:
+            return
+        self._morph_dirty = False
+
         height, width = self.source_image.shape[:2]
-        
-        # Convert normalized points to image coordinates
-        source_points = np.float32([(p.source.x() * width, p.source.y() * height) 
-                                  for p in self.source_canvas.points])
-        target_points = np.float32([(p.target.x() * width, p.target.y() * height) 
-                                  for p in self.source_canvas.points])
-        
+
+        # While a point is being dragged, render the preview at reduced
+        # resolution and upscale; the release does a full-quality pass
+        dragging = self.source_canvas.dragging or self.target_canvas.dragging
+        divisor = self.drag_scale if dragging else 1
+        if divisor > 1:
+            render_w = max(1, width // divisor)
+            render_h = max(1, height // divisor)
+            image = cv2.resize(self.source_image, (render_w, render_h),
+                               interpolation=cv2.INTER_AREA)
+        else:
+            render_w, render_h = width, height
+            image = self.source_image
+
+        # Convert normalized points to image coordinates - one vectorized
+        # multiply, no per-point Python
+        scale = np.float32([render_w, render_h])
+        source_points = points.source * scale
+        target_points = points.target * scale
+
+        # Identity morph (e.g. right after Reset Morph): nothing to warp
+        if np.allclose(source_points, target_points, atol=0.5):
+            self.target_canvas.set_image(self.source_image)
+            return
+
         try:
-            tri = Delaunay(source_points)
-            morphed = self.source_image.copy()
-            
-            for simplex in tri.simplices:
-                src_tri = source_points[simplex]
-                dst_tri = target_points[simplex]
-                
-                warp_mat = cv2.getAffineTransform(src_tri, dst_tri)
-                warped = cv2.warpAffine(self.source_image, warp_mat, 
-                                      (width, height))
-                
-                mask = np.zeros_like(self.source_image)
-                cv2.fillConvexPoly(mask, dst_tri.astype(np.int32), (1, 1, 1))
-                
-                morphed = morphed * (1 - mask) + warped * mask
-            
-            self.target_canvas.set_image(morphed.astype(np.uint8))
+            tri = self.get_triangulation(source_points)
+            minv = self.get_inverse_affines(source_points, target_points, tri.simplices)
+            if divisor > 1:
+                # Coarse preview: the small temporaries are cheap
+                tri_id = rasterize_tri_ids(target_points, tri.simplices,
+                                           render_w, render_h)
+                grid_x, grid_y = np.meshgrid(np.arange(render_w, dtype=np.float32),
+                                             np.arange(render_h, dtype=np.float32))
+                map_x, map_y = fill_maps(tri_id, minv, grid_x, grid_y)
+                small = cv2.remap(image, map_x, map_y, cv2.INTER_LINEAR)
+                morphed = cv2.resize(small, (width, height),
+                                     interpolation=cv2.INTER_LINEAR,
+                                     dst=self._morph_buf)
+            else:
+                tri_id = rasterize_tri_ids(target_points, tri.simplices,
+                                           width, height, out=self._tri_id)
+                map_x, map_y = fill_maps(tri_id, minv, self._grid_x, self._grid_y,
+                                         out_x=self._map_x, out_y=self._map_y)
+                morphed = self._remap(image, map_x, map_y, dst=self._morph_buf)
+            self.target_canvas.set_image(morphed)
         except Exception as e:
             print(f"Morph error: {e}")
 
     def save_template(self):
-        file_name, _ = QFileDialog.getSaveFileName(self, "Save Morph Template", "", "CSV Files (*.csv)")
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save Morph Template", "", "Morph Templates (*.npz)")
         if file_name:
-            with open(file_name, 'w', newline='') as file:
-                writer = csv.writer(file)
-                for point in self.source_canvas.points:
-                    writer.writerow([point.source.x(), point.source.y(), point.target.x(), point.target.y()])
+            points = self.source_canvas.points
+            np.savez_compressed(file_name, src=points.source, tgt=points.target,
+                                locked=points.locked)
 
     def load_template(self):
-        file_name, _ = QFileDialog.getOpenFileName(self, "Load Morph Template", "", "CSV Files (*.csv)")
+        file_name, _ = QFileDialog.getOpenFileName(self, "Load Morph Template", "", "Morph Templates (*.npz)")
         if file_name:
-            with open(file_name, 'r') as file:
-                reader = csv.reader(file)
-                self.source_canvas.points.clear()
-                for row in reader:
-                    src_x, src_y, tgt_x, tgt_y = map(float, row)
-                    self.source_canvas.points.append(MorphPoint(QPointF(src_x, src_y), QPointF(tgt_x, tgt_y)))
+            data = np.load(file_name)
+            self.source_canvas.points.replace(data['src'], data['tgt'])
+            if 'locked' in data:
+                self.source_canvas.points.locked[:] = data['locked']
             self.target_canvas.points = self.source_canvas.points
+            if self.source_image is not None:
+                self._add_border_anchors()
+            self._tri_cache = None
+            self._affine_cache = None
+            self._morph_dirty = True
+            self.source_canvas._display_dirty = True
+            self.target_canvas._display_dirty = True
 
     def save_gif(self):
         from PySide6.QtWidgets import QProgressDialog
@@ -375,44 +829,65 @@ class MorphEditor(QMainWindow):
         loop = self.loop_checkbox.isChecked()
         height, width = self.source_canvas.image.shape[:2]
         
+        scale = np.float32([width, height])
+        source_points = self.source_canvas.points.source * scale
+        target_points = self.source_canvas.points.target * scale
+        tri = self.get_triangulation(source_points)
+
+        # Frames are independent given the endpoint maps, so render them
+        # in parallel workers; consume in submission order to keep the
+        # sequence and drive the progress dialog as results land
         images = []
-        for i in range(num_frames):
-            progress.setValue(i)
-            if progress.wasCanceled():
-                return
-            t = i / (num_frames - 1)
-            morphed = self.interpolate_image(t)
-            images.append(morphed)
-        
+        try:
+            # Build the t=1 maps once up front; every frame after that
+            # is a lerp against the identity grid inside the workers
+            map_x_tgt, map_y_tgt = build_morph_maps(source_points, target_points,
+                                                    tri.simplices, width, height)
+            with ProcessPoolExecutor(initializer=_gif_worker_init,
+                                     initargs=(self.source_canvas.image,
+                                               map_x_tgt, map_y_tgt)) as executor:
+                futures = [executor.submit(render_frame, i / (num_frames - 1))
+                           for i in range(num_frames)]
+                for i, future in enumerate(futures):
+                    progress.setValue(i)
+                    if progress.wasCanceled():
+                        for f in futures:
+                            f.cancel()
+                        return
+                    images.append(future.result())
+        except Exception as e:
+            # Degenerate triangles (e.g. two points dragged onto the same
+            # spot) make the batched solve raise; don't wedge the dialog
+            print(f"Morph error: {e}")
+            progress.cancel()
+            return
+
         if loop:
             images += images[::-1]
         
         file_name, _ = QFileDialog.getSaveFileName(self, "Save GIF", "", "GIF Files (*.gif)")
         if file_name:
             progress.setValue(num_frames)
-            imageio.mimsave(file_name, images, duration=max(1, 100 - self.speed_slider.value()), loop=0 if loop else 1)
-    
-    def interpolate_image(self, t):
-        height, width = self.source_canvas.image.shape[:2]
-        source_points = np.float32([(p.source.x() * width, p.source.y() * height) for p in self.source_canvas.points])
-        target_points = np.float32([(p.target.x() * width, p.target.y() * height) for p in self.source_canvas.points])
-        
-        inter_points = (1 - t) * source_points + t * target_points
+            self.encode_gif(file_name, images, loop)
+
+    def encode_gif(self, file_name, images, loop):
+        """Encode frames to GIF with Pillow using one global palette;
+        fall back to imageio if Pillow isn't around."""
+        duration = max(1, 100 - self.speed_slider.value())
         try:
-            tri = Delaunay(source_points)
-            morphed = np.zeros_like(self.source_canvas.image)
-            for simplex in tri.simplices:
-                src_tri = source_points[simplex]
-                dst_tri = inter_points[simplex]
-                warp_mat = cv2.getAffineTransform(src_tri, dst_tri)
-                warped = cv2.warpAffine(self.source_canvas.image, warp_mat, (width, height))
-                mask = np.zeros_like(self.source_canvas.image)
-                cv2.fillConvexPoly(mask, dst_tri.astype(np.int32), (1, 1, 1))
-                morphed = morphed * (1 - mask) + warped * mask
-            return morphed.astype(np.uint8)
-        except Exception as e:
-            print(f"Morph error: {e}")
-            return self.source_canvas.image
+            from PIL import Image
+        except ImportError:
+            imageio.mimsave(file_name, images, duration=duration, loop=0 if loop else 1)
+            return
+        # Quantize every frame against a single palette taken from the
+        # middle frame instead of rebuilding a color table per frame
+        palette_img = Image.fromarray(images[len(images) // 2]).quantize(colors=256)
+        frames = [Image.fromarray(im).quantize(palette=palette_img,
+                                               dither=Image.FLOYDSTEINBERG)
+                  for im in images]
+        frames[0].save(file_name, save_all=True, append_images=frames[1:],
+                       duration=duration, loop=0 if loop else 1,
+                       disposal=2, optimize=False)
 
 
 def main():